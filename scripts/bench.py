@@ -0,0 +1,641 @@
+#!/usr/bin/env python3
+"""Read-side load generator and latency benchmark for the app's query shapes.
+
+Replays the SQL the Next.js app issues against a locally imported database:
+randomized `buildQuery` list/count queries (filter combinations, pay brackets,
+sensitive-occupation lists, sorts, deep OFFSET pages and keyset cursors) plus the
+fixed aggregate queries behind getFilterOptions, getStats, getHomepageInsights,
+the org chart and the AI exposure page. Queries run at a configurable
+concurrency through a connection pool; the report gives p50/p95/p99 latency
+per shape, the EXPLAIN plan of one representative query per shape, and flags
+shapes whose plan falls back to a sequential scan.
+
+The aggregate SQL is read straight out of the TypeScript sources, so the
+benchmark always exercises the queries the app actually ships.
+
+Usage:
+    python3 scripts/bench.py                          # 500 queries, 8 workers
+    python3 scripts/bench.py --requests 5000 --concurrency 32
+    python3 scripts/bench.py --dataset employment     # list shapes for one dataset
+    python3 scripts/bench.py --only list              # list/count shapes only
+    python3 scripts/bench.py --explain-analyze        # EXPLAIN ANALYZE each shape
+    python3 scripts/bench.py --json bench.json        # also write a JSON report
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import re
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import psycopg2
+from psycopg2.pool import ThreadedConnectionPool
+
+# ---------------------------------------------------------------------------
+# Configuration — mirrors src/lib/queries.ts
+# ---------------------------------------------------------------------------
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATASETS = ["employment", "accessions", "separations"]
+
+SENSITIVE_SERIES_CODES = [
+    "0007", "0082", "0083", "0084", "0132", "0134", "0401", "0436",
+    "0512", "0840", "0930", "1169", "1171", "1801", "1802", "1811",
+    "1812", "1816", "1854", "1881", "1884", "1890", "1895", "1896",
+]
+
+PAY_BRACKETS: dict[str, tuple[int | None, int | None]] = {
+    "under_50k": (None, 50000),
+    "50k_75k": (50000, 75000),
+    "75k_100k": (75000, 100000),
+    "100k_150k": (100000, 150000),
+    "150k_200k": (150000, 200000),
+    "200k_plus": (200000, None),
+}
+
+SORT_ALLOWLIST = [
+    "agency",
+    "duty_station_state",
+    "occupational_series",
+    "grade",
+    "annualized_adjusted_basic_pay",
+    "education_level",
+    "age_bracket",
+    "length_of_service_years",
+]
+
+FILTER_COLUMN_MAP = {
+    "agency_code": "agency_code",
+    "duty_station_state_abbreviation": "duty_station_state_abbreviation",
+    "occupational_group_code": "occupational_group_code",
+    "occupational_series_code": "occupational_series_code",
+    "grade": "grade",
+    "pay_plan_code": "pay_plan_code",
+    "education_level_code": "education_level_code",
+    "age_bracket": "age_bracket",
+    "work_schedule_code": "work_schedule_code",
+    "accession_category_code": "accession_category_code",
+    "separation_category_code": "separation_category_code",
+}
+
+# Filter keys that only exist on one dataset's table.
+DATASET_ONLY_FILTERS = {
+    "accession_category_code": "accessions",
+    "separation_category_code": "separations",
+}
+
+MAX_PAGE_SIZE = 100
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE = 1_000_000
+
+# Pages a user actually reaches: mostly the first few, some paging through,
+# a tail of deep links. Weighted (low, high, weight).
+PAGE_DEPTHS = [(1, 5, 70), (6, 200, 20), (1000, 20000, 10)]
+
+# TypeScript files whose `query(...)` SQL literals are replayed verbatim.
+AGGREGATE_SOURCES = {
+    "filters": "src/lib/filters.ts",
+    "org_chart": "src/app/org-chart/page.tsx",
+    "ai_exposure": "src/app/ai-exposure/page.tsx",
+}
+
+
+# ---------------------------------------------------------------------------
+# Database helpers
+# ---------------------------------------------------------------------------
+
+def get_dsn() -> str:
+    """Return the DATABASE_URL or a DSN for the local default database."""
+    return os.environ.get("DATABASE_URL") or "port=5433 dbname=fedwork"
+
+
+def get_connection():
+    """Return a psycopg2 connection using DATABASE_URL or local defaults."""
+    return psycopg2.connect(get_dsn())
+
+
+# ---------------------------------------------------------------------------
+# buildQuery port
+# ---------------------------------------------------------------------------
+
+def build_query(dataset: str, filters: dict) -> tuple[str, list, str, list]:
+    """Python port of buildQuery() in src/lib/queries.ts.
+
+    Returns (sql, params, count_sql, count_params) using psycopg2 %s
+    placeholders. Keep in step with the TypeScript version.
+    """
+    conditions: list[str] = []
+    params: list = []
+
+    for key, column in FILTER_COLUMN_MAP.items():
+        value = filters.get(key)
+        if value not in (None, ""):
+            conditions.append(f"{column} = %s")
+            params.append(value)
+
+    bracket = PAY_BRACKETS.get(filters.get("pay_bracket") or "")
+    if bracket:
+        low, high = bracket
+        if low is not None:
+            conditions.append("annualized_adjusted_basic_pay >= %s")
+            params.append(low)
+        if high is not None:
+            conditions.append("annualized_adjusted_basic_pay < %s")
+            params.append(high)
+
+    sensitive = filters.get("sensitive_occupation")
+    placeholders = ", ".join(["%s"] * len(SENSITIVE_SERIES_CODES))
+    if sensitive == "all_sensitive":
+        conditions.append(f"occupational_series_code IN ({placeholders})")
+        params.extend(SENSITIVE_SERIES_CODES)
+    elif sensitive == "non_sensitive":
+        conditions.append(
+            "(occupational_series_code IS NULL OR "
+            f"occupational_series_code NOT IN ({placeholders}))"
+        )
+        params.extend(SENSITIVE_SERIES_CODES)
+    elif sensitive in SENSITIVE_SERIES_CODES:
+        conditions.append("occupational_series_code = %s")
+        params.append(sensitive)
+
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    count_sql = f"SELECT COUNT(*) as count FROM {dataset} {where}"
+    count_params = list(params)
+
+    sort = filters.get("sort") if filters.get("sort") in SORT_ALLOWLIST else None
+    direction = "DESC" if (filters.get("sortDir") or "").upper() == "DESC" else "ASC"
+    page_size = min(max(1, filters.get("pageSize") or DEFAULT_PAGE_SIZE), MAX_PAGE_SIZE)
+    page = min(max(1, filters.get("page") or 1), MAX_PAGE)
+
+    order = f"ORDER BY {sort} {direction}, id {direction}" if sort else "ORDER BY id ASC"
+    keyset = filters.get("keyset")
+    if keyset:
+        # (sort value, id) of the previous page's last row; see
+        # keysetConditions() in queries.ts for the NULL-handling branches.
+        value, last_id = keyset
+        if not sort:
+            branches = [("id > %s", [last_id])]
+        elif direction == "ASC":
+            branches = (
+                [(f"{sort} IS NULL AND id > %s", [last_id])] if value is None
+                else [(f"({sort}, id) > (%s, %s)", [value, last_id]), (f"{sort} IS NULL", [])]
+            )
+        else:
+            branches = (
+                [(f"{sort} IS NULL AND id < %s", [last_id]), (f"{sort} IS NOT NULL", [])]
+                if value is None
+                else [(f"({sort}, id) < (%s, %s)", [value, last_id])]
+            )
+        parts = []
+        params = []
+        for cond, cond_params in branches:
+            parts.append(
+                f"SELECT * FROM {dataset} WHERE {' AND '.join(conditions + [cond])} "
+                f"{order} LIMIT %s"
+            )
+            params.extend(count_params + cond_params + [page_size])
+        if len(parts) == 1:
+            return parts[0], params, count_sql, count_params
+        sql = (
+            f"SELECT * FROM ({' UNION ALL '.join(f'({p})' for p in parts)}) AS page "
+            f"{order} LIMIT %s"
+        )
+        return sql, params + [page_size], count_sql, count_params
+
+    sql = f"SELECT * FROM {dataset} {where} {order} LIMIT %s OFFSET %s"
+    return sql, params + [page_size, (page - 1) * page_size], count_sql, count_params
+
+
+# ---------------------------------------------------------------------------
+# Workload generation
+# ---------------------------------------------------------------------------
+
+_QUERY_CALL_RE = re.compile(
+    r"""query(?:<[^>]*>)?\(\s*(?:"((?:[^"\\]|\\.)*)"|`((?:[^`\\]|\\.)*)`)""",
+    re.DOTALL,
+)
+
+
+def sql_literals(source: str) -> list[str]:
+    """Return the SQL literal passed to every `query(...)` call in *source*."""
+    return [" ".join((dq or tpl).split()) for dq, tpl in _QUERY_CALL_RE.findall(source)]
+
+
+def read_source(path: str) -> str:
+    with open(os.path.join(ROOT_DIR, path), "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def aggregate_shapes(datasets: list[str]) -> list[tuple[str, str]]:
+    """Return (shape_name, sql) for the app's fixed aggregate queries."""
+    shapes: list[tuple[str, str]] = []
+
+    # getStats and getHomepageInsights both live in filters.ts after
+    # getFilterOptions; split them by the exported function they belong to.
+    source = read_source(AGGREGATE_SOURCES["filters"])
+    sections = re.split(r"export const (\w+) = unstable_cache", source)
+    # re.split yields [prefix, name1, body1, name2, body2, ...]
+    for name, body in zip(sections[1::2], sections[2::2]):
+        sqls = sql_literals(body)
+        if name == "getFilterOptions":
+            for ds in datasets:
+                for i, sql in enumerate(sqls):
+                    # Category lookups are hard-coded to their own table.
+                    if "${table}" not in sql and f"FROM {ds} " not in sql:
+                        continue
+                    shapes.append((f"filter_options:{ds}[{i}]", sql.replace("${table}", ds)))
+        else:
+            for i, sql in enumerate(sqls):
+                shapes.append((f"{name}[{i}]", sql))
+
+    for i, sql in enumerate(sql_literals(read_source(AGGREGATE_SOURCES["org_chart"]))):
+        shapes.append((f"org_chart[{i}]", sql))
+
+    for i, sql in enumerate(sql_literals(read_source(AGGREGATE_SOURCES["ai_exposure"]))):
+        shapes.append((f"ai_exposure[{i}]", sql))
+
+    return shapes
+
+
+def load_filter_values(conn, datasets: list[str]) -> dict[str, dict[str, list]]:
+    """Sample the real values each filter column takes, per dataset."""
+    values: dict[str, dict[str, list]] = {}
+    cur = conn.cursor()
+    for ds in datasets:
+        values[ds] = {}
+        for key, column in FILTER_COLUMN_MAP.items():
+            if DATASET_ONLY_FILTERS.get(key, ds) != ds:
+                continue
+            cur.execute(
+                f"SELECT DISTINCT {column} FROM {ds} "
+                f"WHERE {column} IS NOT NULL AND {column} <> ''"
+            )
+            found = [row[0] for row in cur.fetchall()]
+            if found:
+                values[ds][key] = found
+        # A small block sample of real rows to seek from, like the
+        # (sort value, id) cursors the app hands out.
+        cur.execute(
+            f"SELECT id, {', '.join(SORT_ALLOWLIST)} FROM {ds} "
+            "TABLESAMPLE SYSTEM (1) LIMIT 500"
+        )
+        values[ds]["_rows"] = [dict(zip(["id"] + SORT_ALLOWLIST, row)) for row in cur.fetchall()]
+    cur.close()
+    return values
+
+
+def random_page(rng: random.Random) -> tuple[int, str]:
+    """Pick a page number and its depth label from PAGE_DEPTHS."""
+    low, high, _ = rng.choices(PAGE_DEPTHS, weights=[w for _, _, w in PAGE_DEPTHS])[0]
+    page = rng.randint(low, high)
+    depth = "shallow" if high <= 5 else "mid" if high <= 200 else "deep"
+    return page, depth
+
+
+def random_list_filters(rng: random.Random, dataset: str, values: dict) -> tuple[dict, str]:
+    """Build a random FilterParams dict and the shape name it belongs to."""
+    ds_values = values[dataset]
+    filters: dict = {"pageSize": rng.choice([25, 50, 50, 50, 100])}
+
+    keys = [k for k in FILTER_COLUMN_MAP if k in ds_values]
+    for key in rng.sample(keys, k=min(len(keys), rng.choice([0, 0, 1, 1, 1, 2, 2, 3]))):
+        filters[key] = rng.choice(ds_values[key])
+    if rng.random() < 0.2:
+        filters["pay_bracket"] = rng.choice(list(PAY_BRACKETS))
+    if rng.random() < 0.1:
+        filters["sensitive_occupation"] = rng.choice(
+            ["all_sensitive", "non_sensitive", rng.choice(SENSITIVE_SERIES_CODES)]
+        )
+
+    n_filters = sum(1 for k in filters if k not in ("pageSize",))
+    shape = f"list:{dataset}:f{min(n_filters, 2)}{'+' if n_filters > 2 else ''}"
+
+    if rng.random() < 0.5:
+        filters["sort"] = rng.choice(SORT_ALLOWLIST)
+        filters["sortDir"] = rng.choice(["asc", "desc"])
+    sort_label = f"sort={filters['sort']}" if "sort" in filters else "unsorted"
+
+    sample = ds_values["_rows"]
+    if rng.random() < 0.3 and sample:
+        row = rng.choice(sample)
+        filters["keyset"] = (row[filters["sort"]] if "sort" in filters else None, row["id"])
+        return filters, f"{shape}:{sort_label}:keyset"
+
+    filters["page"], depth = random_page(rng)
+    return filters, f"{shape}:{sort_label}:{depth}"
+
+
+def generate_workload(
+    rng: random.Random,
+    n: int,
+    datasets: list[str],
+    values: dict,
+    aggregates: list[tuple[str, str]],
+    only: str | None,
+) -> list[tuple[str, str, list | None]]:
+    """Return *n* (shape, sql, params) tuples in the app's rough request mix.
+
+    List pages dominate; every list request issues both its row query and
+    its COUNT(*), as the API routes do. Aggregates are sprinkled in at the
+    rate a cold cache would see them.
+    """
+    work: list[tuple[str, str, list | None]] = []
+    while len(work) < n:
+        if only != "list" and aggregates and (only == "aggregate" or rng.random() < 0.2):
+            shape, sql = rng.choice(aggregates)
+            work.append((shape, sql, None))
+            continue
+        dataset = rng.choice(datasets)
+        filters, shape = random_list_filters(rng, dataset, values)
+        sql, params, count_sql, count_params = build_query(dataset, filters)
+        work.append((shape, sql, params))
+        base = shape.split(":")[:3]
+        work.append((":".join(["count"] + base[1:]), count_sql, count_params))
+    return work[:n]
+
+
+# ---------------------------------------------------------------------------
+# Execution & reporting
+# ---------------------------------------------------------------------------
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already-sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def run_workload(pool: ThreadedConnectionPool, work, concurrency: int) -> tuple[dict, dict, float]:
+    """Execute *work* across *concurrency* threads.
+
+    Returns ({shape: [latency_ms, ...]}, {shape: error_count}, wall_seconds).
+    """
+    latencies: dict[str, list[float]] = {}
+    errors: dict[str, int] = {}
+    lock = threading.Lock()
+    done = 0
+
+    def execute(item):
+        nonlocal done
+        shape, sql, params = item
+        conn = pool.getconn()
+        try:
+            cur = conn.cursor()
+            t0 = time.perf_counter()
+            try:
+                cur.execute(sql, params)
+                cur.fetchall()
+                ok = True
+            except psycopg2.Error as exc:
+                conn.rollback()
+                ok = False
+                with lock:
+                    errors[shape] = errors.get(shape, 0) + 1
+                    if sum(errors.values()) <= 5:
+                        print(f"\n  Query error in {shape}: {str(exc).strip()}")
+            elapsed = (time.perf_counter() - t0) * 1000
+            cur.close()
+        finally:
+            pool.putconn(conn)
+        with lock:
+            if ok:
+                latencies.setdefault(shape, []).append(elapsed)
+            done += 1
+            if done % 50 == 0 or done == len(work):
+                print(f"\r  {done}/{len(work)} queries", end="", flush=True)
+
+    t0 = time.time()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(execute, work))
+    print()
+    return latencies, errors, time.time() - t0
+
+
+def plan_node_types(plan: dict) -> list[tuple[str, str | None]]:
+    """Flatten an EXPLAIN (FORMAT JSON) plan into (node type, relation) pairs."""
+    nodes = [(plan.get("Node Type"), plan.get("Relation Name"))]
+    for child in plan.get("Plans", []):
+        nodes.extend(plan_node_types(child))
+    return nodes
+
+
+def plan_text(plan: dict, depth: int = 0) -> list[str]:
+    """Render an EXPLAIN (FORMAT JSON) plan as indented text lines.
+
+    Includes actual timings and buffer counts when the plan was analyzed.
+    """
+    label = plan.get("Node Type", "?")
+    if plan.get("Relation Name"):
+        label += f" on {plan['Relation Name']}"
+    if plan.get("Index Name"):
+        label += f" using {plan['Index Name']}"
+    line = (
+        f"{label}  (cost={plan.get('Startup Cost', 0):.2f}..{plan.get('Total Cost', 0):.2f}"
+        f" rows={plan.get('Plan Rows', 0)})"
+    )
+    if "Actual Total Time" in plan:
+        line += (
+            f" (actual time={plan['Actual Startup Time']:.3f}..{plan['Actual Total Time']:.3f}"
+            f" rows={plan.get('Actual Rows', 0)} loops={plan.get('Actual Loops', 1)})"
+        )
+    lines = [("  " * depth + "-> " if depth else "") + line]
+    pad = "  " * depth + ("   " if depth else "  ")
+    for key in ("Index Cond", "Filter", "Sort Key"):
+        if key in plan:
+            value = plan[key]
+            lines.append(f"{pad}{key}: {', '.join(value) if isinstance(value, list) else value}")
+    buffers = [
+        f"{kind}={plan[f'Shared {kind.title()} Blocks']}"
+        for kind in ("hit", "read")
+        if plan.get(f"Shared {kind.title()} Blocks")
+    ]
+    if buffers:
+        lines.append(f"{pad}Buffers: shared {' '.join(buffers)}")
+    for child in plan.get("Plans", []):
+        lines.extend(plan_text(child, depth + 1))
+    return lines
+
+
+def explain_shapes(conn, samples: dict[str, tuple[str, list | None]], analyze: bool) -> dict[str, dict]:
+    """EXPLAIN one representative query per shape, in a single round trip each."""
+    options = "ANALYZE, BUFFERS, FORMAT JSON" if analyze else "FORMAT JSON"
+    plans: dict[str, dict] = {}
+    cur = conn.cursor()
+    for shape, (sql, params) in sorted(samples.items()):
+        try:
+            cur.execute(f"EXPLAIN ({options}) {sql}", params)
+            result = cur.fetchone()[0][0]
+        except psycopg2.Error as exc:
+            conn.rollback()
+            plans[shape] = {"error": str(exc).strip()}
+            continue
+        plan = result["Plan"]
+        text = "\n".join(plan_text(plan))
+        if "Execution Time" in result:
+            text += f"\nExecution Time: {result['Execution Time']:.3f} ms"
+        seq_scans = sorted({rel for node, rel in plan_node_types(plan) if node == "Seq Scan" and rel})
+        plans[shape] = {"plan": text, "seq_scans": seq_scans, "total_cost": plan.get("Total Cost")}
+    cur.close()
+    return plans
+
+
+def build_report(latencies: dict, errors: dict, plans: dict) -> list[dict]:
+    """Combine latencies, errors and plans into one row per shape.
+
+    Shapes whose queries all failed have no latencies but are still reported,
+    with their error count and EXPLAIN error. Failing shapes sort first, then
+    the slowest p95.
+    """
+    rows = []
+    for shape in sorted(set(latencies) | set(errors) | set(plans)):
+        values = sorted(latencies.get(shape, []))
+        info = plans.get(shape, {})
+        rows.append({
+            "shape": shape,
+            "n": len(values),
+            "errors": errors.get(shape, 0),
+            "p50_ms": round(percentile(values, 50), 2) if values else None,
+            "p95_ms": round(percentile(values, 95), 2) if values else None,
+            "p99_ms": round(percentile(values, 99), 2) if values else None,
+            "max_ms": round(values[-1], 2) if values else None,
+            "seq_scans": info.get("seq_scans", []),
+            "total_cost": info.get("total_cost"),
+            "plan": info.get("plan") or info.get("error"),
+            "explain_error": info.get("error"),
+        })
+    rows.sort(key=lambda r: (not (r["errors"] or r["explain_error"]), -(r["p95_ms"] or 0)))
+    return rows
+
+
+def print_report(rows: list[dict], show_plans: bool) -> None:
+    width = max([len(r["shape"]) for r in rows] + [5])
+    def ms(value: float | None) -> str:
+        return f"{value:>7.1f}ms" if value is not None else f"{'-':>9}"
+
+    print(f"  {'shape':<{width}}  {'n':>5}  {'errors':>6}  {'p50':>9}  {'p95':>9}  {'p99':>9}  seq scan")
+    for r in rows:
+        flag = ", ".join(r["seq_scans"]) if r["seq_scans"] else ""
+        print(
+            f"  {r['shape']:<{width}}  {r['n']:>5}  {r['errors']:>6}  {ms(r['p50_ms'])}"
+            f"  {ms(r['p95_ms'])}  {ms(r['p99_ms'])}  {flag}"
+        )
+
+    failing = [r for r in rows if r["errors"] or r["explain_error"]]
+    print()
+    if failing:
+        print(f"  {len(failing)} shape(s) had failing queries:")
+        for r in failing:
+            if r["errors"]:
+                print(f"    {r['shape']}: {r['errors']} of {r['n'] + r['errors']} failed")
+            if r["explain_error"]:
+                print(f"    {r['shape']}: EXPLAIN failed: {r['explain_error'].splitlines()[0]}")
+        print()
+
+    flagged = [r for r in rows if r["seq_scans"]]
+    if flagged:
+        print(f"  {len(flagged)} shape(s) fall back to a sequential scan:")
+        for r in flagged:
+            print(f"    {r['shape']}: {', '.join(r['seq_scans'])}")
+    else:
+        print("  No shape falls back to a sequential scan.")
+
+    if show_plans:
+        for r in rows:
+            print()
+            print(f"  -- {r['shape']} --")
+            for line in (r["plan"] or "").splitlines():
+                print(f"    {line}")
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the app's read queries against a local database.",
+    )
+    parser.add_argument(
+        "--requests", type=int, default=500,
+        help="Number of queries to run (default: 500).",
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=8,
+        help="Concurrent workers / pooled connections (default: 8).",
+    )
+    parser.add_argument(
+        "--dataset", choices=DATASETS,
+        help="Generate list queries for one dataset only.",
+    )
+    parser.add_argument(
+        "--only", choices=["list", "aggregate"],
+        help="Run only buildQuery list/count shapes or only aggregate shapes.",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=0,
+        help="Random seed for the workload (default: 0).",
+    )
+    parser.add_argument(
+        "--explain-analyze", action="store_true",
+        help="Use EXPLAIN ANALYZE (executes each representative query again).",
+    )
+    parser.add_argument(
+        "--plans", action="store_true",
+        help="Print the full EXPLAIN plan for every shape.",
+    )
+    parser.add_argument(
+        "--json", metavar="PATH",
+        help="Write the report (including plans) as JSON to PATH.",
+    )
+    args = parser.parse_args()
+
+    if args.requests < 1 or args.concurrency < 1:
+        sys.exit("Error: --requests and --concurrency must be positive integers.")
+
+    rng = random.Random(args.seed)
+    datasets = [args.dataset] if args.dataset else DATASETS
+
+    conn = get_connection()
+    conn.autocommit = True
+    print("Sampling filter values ...")
+    values = load_filter_values(conn, datasets)
+    aggregates = aggregate_shapes(datasets) if args.only != "list" else []
+    print(f"  {len(aggregates)} aggregate shape(s) loaded from the app sources")
+
+    work = generate_workload(rng, args.requests, datasets, values, aggregates, args.only)
+    samples: dict[str, tuple[str, list | None]] = {}
+    for shape, sql, params in work:
+        samples.setdefault(shape, (sql, params))
+
+    print(f"Running {len(work):,} queries across {len(samples)} shape(s) "
+          f"at concurrency {args.concurrency} ...")
+    pool = ThreadedConnectionPool(1, args.concurrency, get_dsn())
+    try:
+        latencies, errors, wall = run_workload(pool, work, args.concurrency)
+    finally:
+        pool.closeall()
+    total_errors = sum(errors.values())
+    print(f"  {len(work) / wall:.1f} queries/s over {wall:.1f}s, {total_errors} error(s)")
+
+    print("Explaining shapes ...")
+    plans = explain_shapes(conn, samples, args.explain_analyze)
+    conn.close()
+
+    rows = build_report(latencies, errors, plans)
+    print()
+    print_report(rows, args.plans)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"queries": len(work), "errors": total_errors, "wall_seconds": wall, "shapes": rows}, f, indent=2)
+        print(f"\nReport written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,16 +2,29 @@
 """Bulk-load OPM pipe-delimited data files into PostgreSQL using COPY.
 
 Usage:
-    python3 scripts/import.py <dataset_type> <file_path>
+    python3 scripts/import.py <dataset_type> <file_path> [--error-budget N] [--quarantine PATH]
 
 Examples:
     python3 scripts/import.py accessions  accessions_202512_1_2026-02-20.txt
     python3 scripts/import.py separations separations_202512_1_2026-02-20.txt
     python3 scripts/import.py employment  employment_202512_1_2026-02-20.txt
+    python3 scripts/import.py employment  employment_202512_1_2026-02-20.txt --error-budget 0
+    python3 scripts/import.py ai-exposure   # reload scores + recompute aggregates
+
+Rows that would make COPY fail (wrong field count, malformed numbers or
+YYYYMM months, empty required fields, over-long text) are written to a
+quarantine file with their line numbers instead of aborting the load, as long
+as they stay within the error budget.
+
+Every employment load also reloads src/data/ai-exposure-scores.json into
+ai_exposure_scores and precomputes the /ai-exposure page's aggregates.
 """
 
+import argparse
 import hashlib
 import io
+import itertools
+import json
 import os
 import re
 import sys
@@ -19,6 +32,7 @@ import time
 
 import psycopg2
 import requests
+from psycopg2.extras import execute_values
 
 VALID_DATASETS = {"employment", "accessions", "separations"}
 
@@ -35,6 +49,22 @@ REQUIRED_COLUMNS: dict[str, set[str]] = {
     "separations": {"count", "personnel_action_effective_date_yyyymm"},
 }
 
+# Source columns holding a YYYYMM month. snapshot_yyyymm has a CHECK
+# constraint and both drive month-level supersede/prune logic.
+YYYYMM_COLUMNS = {"snapshot_yyyymm", "personnel_action_effective_date_yyyymm"}
+
+# Rows that may be quarantined before the import is aborted: a fraction of
+# the data rows when < 1, an absolute row count otherwise. 0 restores the
+# all-or-nothing behaviour.
+DEFAULT_ERROR_BUDGET = 0.001
+
+# Data lines validated per chunk.
+VALIDATION_CHUNK_LINES = 50_000
+
+
+class ErrorBudgetExceeded(Exception):
+    """Raised mid-COPY once more rows were quarantined than the budget allows."""
+
 
 def db_column_for(col: str) -> str:
     """Map a source-file column name to its DB column name."""
@@ -68,12 +98,128 @@ def extract_snapshot_month(filepath: str) -> str | None:
     return m.group(1) if m else None
 
 
+def _uint_upto(limit: int) -> str:
+    """Regex for a decimal integer in 0..*limit* (leading zeros allowed)."""
+    digits = str(limit)
+    alternatives = [rf"\d{{1,{len(digits) - 1}}}"] if len(digits) > 1 else []
+    for i, d in enumerate(digits):
+        if d != "0":
+            rest = len(digits) - i - 1
+            alternatives.append(
+                digits[:i] + f"[0-{int(d) - 1}]" + (rf"\d{{{rest}}}" if rest else "")
+            )
+    alternatives.append(digits)
+    return f"0*(?:{'|'.join(alternatives)})"
+
+
+# A value that COPY's CSV parser reads unchanged: no quote character at all,
+# or a single fully quoted field with any embedded quotes doubled. Anything
+# else (a stray or unbalanced quote) makes COPY abort mid-stream.
+_CSV_FIELD = re.compile(r'[^"]*|"(?:[^"]|"")*"')
+
+
+class _RowValidator:
+    """Chunk-wise checks that data rows will survive COPY.
+
+    Checks run column by column over a whole chunk: each checked column is
+    joined into one string and matched with a single regex (or, for length
+    limits, a single max()), and only a column that fails is re-scanned value
+    by value to find the offending rows. Clean chunks — nearly all of them —
+    never pay per-value Python overhead.
+    """
+
+    def __init__(
+        self,
+        file_columns: list[str],
+        keep_indices: list[int],
+        column_types: dict[str, tuple],
+        required: set[str],
+    ):
+        self._n_fields = len(file_columns)
+        self._quote_checks = [(i, file_columns[i]) for i in keep_indices]
+        null = re.escape(_PreprocessedStream.NULL_SENTINEL)
+        # (file index, column name, value pattern or None, max length or None)
+        self._checks: list[tuple[int, str, re.Pattern | None, int | None]] = []
+        for i in keep_indices:
+            col = file_columns[i]
+            data_type, max_len, precision, scale = column_types[db_column_for(col)]
+            pattern = None
+            if col in YYYYMM_COLUMNS:
+                pattern = r"\d{4}(?:0[1-9]|1[0-2])"
+            elif data_type == "numeric":
+                # Plain decimal notation only. Postgres also takes exponents
+                # ('1e5'), but a regex can't bound their magnitude against the
+                # column's precision, so those are deliberately quarantined
+                # rather than risk a numeric overflow aborting the COPY.
+                digits = f"{{1,{precision - scale}}}" if precision else "+"
+                pattern = rf"[+-]?(?:\d{digits}(?:\.\d*)?|\.\d+)"
+                if col in NUMERIC_COLUMNS and col not in required:
+                    pattern = f"(?:{pattern})?"  # empty becomes NULL
+            elif data_type == "integer":
+                pattern = rf"(?:\+?{_uint_upto(2**31 - 1)}|-{_uint_upto(2**31)})"
+            if pattern is not None and col not in required:
+                # COPY loads the sentinel as NULL. Required columns must
+                # not be NULL, so there it is quarantined like any bad value.
+                pattern = f"(?:{null}|{pattern})"
+            if pattern is None and col in required:
+                pattern = rf"(?!{null}(?:\n|\Z)).+"
+            if pattern is None and max_len is None:
+                continue
+            compiled = re.compile(pattern) if pattern else None
+            self._checks.append((i, col, compiled, max_len))
+        # Same patterns, anchored per line, for the whole-column fast path.
+        self._column_patterns = {
+            i: re.compile(f"(?:{p.pattern})(?:\n(?:{p.pattern}))*")
+            for i, _, p, _ in self._checks
+            if p is not None
+        }
+
+    def validate(self, rows: list[list[str]]) -> dict[int, str]:
+        """Return {position in *rows*: reason} for every row that would fail."""
+        bad: dict[int, str] = {}
+        for pos, row in enumerate(rows):
+            if len(row) != self._n_fields:
+                bad[pos] = f"expected {self._n_fields} fields, found {len(row)}"
+        candidates = [pos for pos in range(len(rows)) if pos not in bad]
+        if not candidates:
+            return bad
+
+        for i, col, pattern, max_len in self._checks:
+            values = [rows[pos][i] for pos in candidates]
+            if pattern is not None and not self._column_patterns[i].fullmatch("\n".join(values)):
+                for pos, value in zip(candidates, values):
+                    if pos not in bad and not pattern.fullmatch(value):
+                        bad[pos] = f"invalid {col}: {value!r}"
+            if max_len is not None and max(map(len, values)) > max_len:
+                for pos, value in zip(candidates, values):
+                    if (
+                        pos not in bad
+                        and len(value) > max_len
+                        and value != _PreprocessedStream.NULL_SENTINEL
+                    ):
+                        bad[pos] = f"{col} longer than {max_len} characters"
+
+        for i, col in self._quote_checks:
+            values = [rows[pos][i] for pos in candidates]
+            if '"' in "".join(values):
+                for pos, value in zip(candidates, values):
+                    if pos not in bad and not _CSV_FIELD.fullmatch(value):
+                        bad[pos] = f"unbalanced quote in {col}: {value!r}"
+        return bad
+
+
 class _PreprocessedStream(io.RawIOBase):
-    """A read-only binary stream that projects and fixes rows on the fly.
+    """A read-only binary stream that validates, projects and fixes rows on the fly.
+
+    Data lines are read in chunks of VALIDATION_CHUNK_LINES and checked by a
+    _RowValidator; rows that would make COPY fail are written to the
+    quarantine file (line number, reason, original line) instead of being
+    streamed, and ErrorBudgetExceeded is raised once more than *max_rejects*
+    rows have been quarantined.
 
-    Every line is projected down to *keep_indices* (the file columns that
-    exist in the target table — OPM adds new columns over time and those are
-    skipped). On data lines, fields at *numeric_indices* (positions within
+    Every streamed line is projected down to *keep_indices* (the file columns
+    that exist in the target table — OPM adds new columns over time and those
+    are skipped). On data lines, fields at *numeric_indices* (positions within
     the projected row) that are empty strings are replaced with the NULL
     sentinel so PostgreSQL COPY ... NULL 'REDACTED' turns them into real
     NULLs, and every row is tagged with import_id.
@@ -88,14 +234,29 @@ class _PreprocessedStream(io.RawIOBase):
         keep_indices: list[int],
         numeric_indices: set[int],
         import_id: int,
+        validator: _RowValidator,
+        quarantine_path: str,
+        max_rejects: int,
     ):
         self._file = open(filepath, "r", encoding="utf-8")
         self._keep_indices = keep_indices
         self._numeric_indices = numeric_indices
         self._import_id = import_id
+        self._validator = validator
+        self._quarantine_path = quarantine_path
+        self._quarantine = None
+        self._max_rejects = max_rejects
         self._buffer = b""
         self._exhausted = False
-        self._is_first_line = True
+        self._line_no = 1
+        self.rejected = 0
+
+        # Header is skipped by COPY (HEADER TRUE); keep its field count
+        # aligned with the data rows (+ synthetic import_id).
+        header = self._file.readline().rstrip("\n").split(self.DELIMITER)
+        parts = [header[i] for i in keep_indices]
+        parts.append("import_id")
+        self._buffer = (self.DELIMITER.join(parts) + "\n").encode("utf-8")
 
     # -- io.RawIOBase interface -------------------------------------------
 
@@ -105,27 +266,11 @@ class _PreprocessedStream(io.RawIOBase):
     def readinto(self, b: bytearray) -> int:
         """Fill *b* with preprocessed bytes, returning bytes written."""
         while len(self._buffer) < len(b) and not self._exhausted:
-            line = self._file.readline()
-            if not line:
+            lines = list(itertools.islice(self._file, VALIDATION_CHUNK_LINES))
+            if not lines:
                 self._exhausted = True
                 break
-            raw = line.rstrip("\n").split(self.DELIMITER)
-            # Project to the columns that exist in the DB table. A malformed
-            # short line raises IndexError, aborting the COPY loudly.
-            parts = [raw[i] for i in self._keep_indices]
-            if self._is_first_line:
-                # Header is skipped by COPY (HEADER TRUE); keep its field
-                # count aligned with the data rows (+ synthetic import_id).
-                self._is_first_line = False
-                parts.append("import_id")
-                self._buffer += (self.DELIMITER.join(parts) + "\n").encode("utf-8")
-                continue
-            # Data line: fix empty numeric fields, then tag with import_id.
-            for idx in self._numeric_indices:
-                if parts[idx] == "":
-                    parts[idx] = self.NULL_SENTINEL
-            parts.append(str(self._import_id))
-            self._buffer += (self.DELIMITER.join(parts) + "\n").encode("utf-8")
+            self._buffer += self._process_chunk(lines)
 
         n = min(len(b), len(self._buffer))
         b[:n] = self._buffer[:n]
@@ -134,8 +279,213 @@ class _PreprocessedStream(io.RawIOBase):
 
     def close(self):
         self._file.close()
+        if self._quarantine:
+            self._quarantine.close()
         super().close()
 
+    # -- helpers -------------------------------------------------------------
+
+    def _process_chunk(self, lines: list[str]) -> bytes:
+        first_line_no = self._line_no + 1
+        self._line_no += len(lines)
+        rows = [line.rstrip("\n").split(self.DELIMITER) for line in lines]
+        bad = self._validator.validate(rows)
+        if bad:
+            self._reject(first_line_no, lines, bad)
+
+        out: list[str] = []
+        import_id = str(self._import_id)
+        for pos, raw in enumerate(rows):
+            if pos in bad:
+                continue
+            parts = [raw[i] for i in self._keep_indices]
+            # Data line: fix empty numeric fields, then tag with import_id.
+            for idx in self._numeric_indices:
+                if parts[idx] == "":
+                    parts[idx] = self.NULL_SENTINEL
+            parts.append(import_id)
+            out.append(self.DELIMITER.join(parts))
+        if not out:
+            return b""
+        return ("\n".join(out) + "\n").encode("utf-8")
+
+    def _reject(self, first_line_no: int, lines: list[str], bad: dict[int, str]) -> None:
+        if self._quarantine is None:
+            self._quarantine = open(self._quarantine_path, "w", encoding="utf-8")
+            self._quarantine.write("line\treason\trow\n")
+        for pos in sorted(bad):
+            self._quarantine.write(
+                f"{first_line_no + pos}\t{bad[pos]}\t{lines[pos].rstrip(chr(10))}\n"
+            )
+        self.rejected += len(bad)
+        if self.rejected > self._max_rejects:
+            self._quarantine.flush()
+            raise ErrorBudgetExceeded(
+                f"{self.rejected:,} malformed row(s) exceed the error budget of "
+                f"{self._max_rejects:,}; see {self._quarantine_path}"
+            )
+
+
+# ---------------------------------------------------------------------------
+# AI exposure precompute
+# ---------------------------------------------------------------------------
+
+AI_EXPOSURE_SCORES_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "src", "data", "ai-exposure-scores.json",
+)
+
+# Treemap dataset for /ai-exposure: per-series headcount, pay, STEM flag and
+# most common education level.
+AI_EXPOSURE_OCCUPATIONS_SQL = """
+    INSERT INTO ai_exposure_occupations
+        (occupational_series, occupational_series_code, occupational_group,
+         occupational_group_code, total_employees, avg_pay, is_stem, top_education)
+    WITH occ AS (
+      SELECT
+        occupational_series,
+        occupational_series_code,
+        occupational_group,
+        occupational_group_code,
+        SUM(employee_count) AS total_employees,
+        ROUND(AVG(annualized_adjusted_basic_pay)) AS avg_pay,
+        BOOL_OR(stem_occupation IS NOT NULL AND stem_occupation != '' AND stem_occupation != 'UNSPECIFIED') AS is_stem
+      FROM employment
+      WHERE occupational_series IS NOT NULL
+        AND occupational_series != ''
+        AND occupational_series != 'INVALID'
+      GROUP BY occupational_series, occupational_series_code,
+               occupational_group, occupational_group_code
+      HAVING SUM(employee_count) >= 50
+    ),
+    edu AS (
+      SELECT DISTINCT ON (occupational_series_code)
+        occupational_series_code,
+        education_level
+      FROM (
+        SELECT occupational_series_code, education_level,
+               SUM(employee_count) AS cnt
+        FROM employment
+        WHERE education_level IS NOT NULL
+        GROUP BY occupational_series_code, education_level
+      ) sub
+      ORDER BY occupational_series_code, cnt DESC
+    )
+    SELECT
+      occ.*,
+      edu.education_level AS top_education
+    FROM occ
+    LEFT JOIN edu ON edu.occupational_series_code = occ.occupational_series_code
+"""
+
+# Employee-weighted exposure by age and education bucket.
+AI_EXPOSURE_BREAKDOWNS_SQL = """
+    INSERT INTO ai_exposure_breakdowns (dim, bucket, employees, weighted_exposure, sort_order)
+    WITH scored AS (
+      SELECT e.age_bracket, e.education_level, e.employee_count, s.score
+      FROM employment e
+      INNER JOIN ai_exposure_scores s
+        ON e.occupational_series_code = s.occupational_series_code
+    )
+    SELECT 'age' AS dim, bucket, SUM(emp) AS employees, SUM(wt) AS weighted_exposure, MIN(sort_order) AS sort_order
+    FROM (
+      SELECT
+        CASE
+          WHEN age_bracket IN ('LESS THAN 20','20-24','25-29') THEN 'Under 30'
+          WHEN age_bracket IN ('30-34','35-39','40-44') THEN '30-44'
+          WHEN age_bracket IN ('45-49','50-54') THEN '45-54'
+          WHEN age_bracket IN ('55-59','60-64','65 OR MORE') THEN '55+'
+        END AS bucket,
+        employee_count AS emp,
+        employee_count * score AS wt,
+        CASE
+          WHEN age_bracket IN ('LESS THAN 20','20-24','25-29') THEN 1
+          WHEN age_bracket IN ('30-34','35-39','40-44') THEN 2
+          WHEN age_bracket IN ('45-49','50-54') THEN 3
+          WHEN age_bracket IN ('55-59','60-64','65 OR MORE') THEN 4
+        END AS sort_order
+      FROM scored
+      WHERE age_bracket IS NOT NULL AND age_bracket != ''
+    ) a
+    WHERE bucket IS NOT NULL
+    GROUP BY bucket
+    UNION ALL
+    SELECT 'edu' AS dim, bucket, SUM(emp), SUM(wt), MIN(sort_order)
+    FROM (
+      SELECT
+        CASE
+          WHEN education_level IN ('HIGH SCHOOL GRADUATE OR CERTIFICATE OF EQUIVALENCY','SOME HIGH SCHOOL - DID NOT COMPLETE','ELEMENTARY SCHOOL COMPLETED - NO HIGH SCHOOL','NO FORMAL EDUCATION OR SOME ELEMENTARY SCHOOL - DID NOT COMPLETE') THEN 'HS or less'
+          WHEN education_level IN ('SOME COLLEGE - LESS THAN ONE YEAR','ONE YEAR COLLEGE','TWO YEARS COLLEGE','THREE YEARS COLLEGE','ASSOCIATE DEGREE','TERMINAL OCCUPATIONAL PROGRAM - CERTIFICATE OF COMPLETION, DIPLOMA OR EQUIVALENT','TERMINAL OCCUPATIONAL PROGRAM - DID NOT COMPLETE') THEN 'Some college'
+          WHEN education_level IN ('BACHELOR''S DEGREE','FOUR YEARS COLLEGE','POST-BACHELOR''S','MASTER''S DEGREE','POST-MASTER''S') THEN 'BS / MS'
+          WHEN education_level IN ('SIXTH-YEAR DEGREE','POST-SIXTH YEAR','DOCTORATE DEGREE','POST-DOCTORATE','FIRST PROFESSIONAL','POST-FIRST PROFESSIONAL') THEN 'Doctorate+'
+        END AS bucket,
+        employee_count AS emp,
+        employee_count * score AS wt,
+        CASE
+          WHEN education_level IN ('HIGH SCHOOL GRADUATE OR CERTIFICATE OF EQUIVALENCY','SOME HIGH SCHOOL - DID NOT COMPLETE','ELEMENTARY SCHOOL COMPLETED - NO HIGH SCHOOL','NO FORMAL EDUCATION OR SOME ELEMENTARY SCHOOL - DID NOT COMPLETE') THEN 1
+          WHEN education_level IN ('SOME COLLEGE - LESS THAN ONE YEAR','ONE YEAR COLLEGE','TWO YEARS COLLEGE','THREE YEARS COLLEGE','ASSOCIATE DEGREE','TERMINAL OCCUPATIONAL PROGRAM - CERTIFICATE OF COMPLETION, DIPLOMA OR EQUIVALENT','TERMINAL OCCUPATIONAL PROGRAM - DID NOT COMPLETE') THEN 2
+          WHEN education_level IN ('BACHELOR''S DEGREE','FOUR YEARS COLLEGE','POST-BACHELOR''S','MASTER''S DEGREE','POST-MASTER''S') THEN 3
+          WHEN education_level IN ('SIXTH-YEAR DEGREE','POST-SIXTH YEAR','DOCTORATE DEGREE','POST-DOCTORATE','FIRST PROFESSIONAL','POST-FIRST PROFESSIONAL') THEN 4
+        END AS sort_order
+      FROM scored
+      WHERE education_level IS NOT NULL AND education_level NOT IN ('NO DATA REPORTED','INVALID','')
+    ) e
+    WHERE bucket IS NOT NULL
+    GROUP BY bucket
+"""
+
+
+def refresh_ai_exposure(cur) -> None:
+    """Load the AI exposure scores and precompute the /ai-exposure aggregates.
+
+    Runs on *cur*'s open transaction; the caller commits.
+    """
+    with open(AI_EXPOSURE_SCORES_PATH, "r", encoding="utf-8") as f:
+        scores = json.load(f)
+
+    cur.execute("DELETE FROM ai_exposure_scores")
+    execute_values(
+        cur,
+        "INSERT INTO ai_exposure_scores (occupational_series_code, score, rationale) VALUES %s",
+        [(code, s["score"], s.get("rationale")) for code, s in scores.items()],
+    )
+    cur.execute("DELETE FROM ai_exposure_occupations")
+    cur.execute(AI_EXPOSURE_OCCUPATIONS_SQL)
+    occupations = cur.rowcount
+    cur.execute("DELETE FROM ai_exposure_breakdowns")
+    cur.execute(AI_EXPOSURE_BREAKDOWNS_SQL)
+    print(
+        f"  AI exposure: {len(scores):,} score(s), {occupations:,} occupation(s) precomputed."
+    )
+
+
+def rebuild_ai_exposure() -> None:
+    """Rebuild the AI exposure tables in their own transaction.
+
+    The tables are derived from the employment snapshot and can always be
+    rebuilt, so this runs after an employment load has committed: a failure
+    here must never roll back the load itself.
+    """
+    conn = get_connection()
+    cur = conn.cursor()
+    try:
+        refresh_ai_exposure(cur)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+
+def run_ai_exposure_refresh() -> None:
+    """Rebuild the AI exposure tables from the current employment snapshot."""
+    try:
+        rebuild_ai_exposure()
+    except Exception as exc:
+        sys.exit(f"AI exposure refresh failed: {exc}")
+    revalidate_cache()
+
 
 def revalidate_cache() -> None:
     """Notify the Next.js app to revalidate cached data after import.
@@ -160,8 +510,17 @@ def revalidate_cache() -> None:
         print(f"Warning: cache revalidation failed: {exc}")
 
 
-def run_import(dataset_type: str, filepath: str) -> None:
-    """Import *filepath* into the *dataset_type* table."""
+def run_import(
+    dataset_type: str,
+    filepath: str,
+    error_budget: float = DEFAULT_ERROR_BUDGET,
+    quarantine_path: str | None = None,
+) -> None:
+    """Import *filepath* into the *dataset_type* table.
+
+    Malformed rows go to *quarantine_path* (default: next to the file) and
+    the rest loads, unless more than *error_budget* rows are malformed.
+    """
 
     # ---- validate args --------------------------------------------------
     if dataset_type not in VALID_DATASETS:
@@ -201,10 +560,13 @@ def run_import(dataset_type: str, filepath: str) -> None:
     # actual table columns so schema evolution is a deliberate migration, not
     # a nightly import failure. Skipped columns are logged loudly.
     cur.execute(
-        "SELECT column_name FROM information_schema.columns WHERE table_name = %s",
+        """SELECT column_name, data_type, character_maximum_length,
+                  numeric_precision, numeric_scale
+             FROM information_schema.columns WHERE table_name = %s""",
         (table,),
     )
-    table_columns = {row[0] for row in cur.fetchall()}
+    column_types = {row[0]: row[1:] for row in cur.fetchall()}
+    table_columns = set(column_types)
 
     keep_indices = [
         i for i, col in enumerate(file_columns) if db_column_for(col) in table_columns
@@ -242,6 +604,19 @@ def run_import(dataset_type: str, filepath: str) -> None:
     data_rows = total_lines - 1  # subtract header
     print(f"  {data_rows:,} data rows")
 
+    if error_budget < 1:
+        max_rejects = int(data_rows * error_budget)
+    else:
+        max_rejects = int(error_budget)
+    if quarantine_path is None:
+        quarantine_path = filepath + ".quarantine.tsv"
+    # A quarantine file from an earlier run of this file would be misleading.
+    if os.path.exists(quarantine_path):
+        os.remove(quarantine_path)
+    validator = _RowValidator(
+        file_columns, keep_indices, column_types, REQUIRED_COLUMNS[dataset_type]
+    )
+
     # ---- extract snapshot month ------------------------------------------
     snapshot_month = extract_snapshot_month(filepath)
 
@@ -290,7 +665,15 @@ def run_import(dataset_type: str, filepath: str) -> None:
     print(f"Importing into {table} via COPY ...")
     t0 = time.time()
 
-    stream = _PreprocessedStream(filepath, keep_indices, numeric_indices, import_id)
+    stream = _PreprocessedStream(
+        filepath,
+        keep_indices,
+        numeric_indices,
+        import_id,
+        validator,
+        quarantine_path,
+        max_rejects,
+    )
     buffered = io.BufferedReader(stream, buffer_size=1 << 20)
 
     try:
@@ -316,6 +699,15 @@ def run_import(dataset_type: str, filepath: str) -> None:
                 (import_id,),
             )
 
+        # Mark the import complete in the same transaction as its rows: the
+        # app's list cache keys results on the latest complete import, so
+        # rows must never go live without the status that announces them.
+        loaded_rows = data_rows - stream.rejected
+        cur.execute(
+            "UPDATE data_imports SET status = 'complete', row_count = %s WHERE id = %s",
+            (loaded_rows, import_id),
+        )
+
         conn.commit()
     except Exception as exc:
         conn.rollback()
@@ -336,31 +728,59 @@ def run_import(dataset_type: str, filepath: str) -> None:
     cur.execute(f"SELECT COUNT(*) FROM {table}")
     db_count = cur.fetchone()[0]
 
-    # ---- mark import complete --------------------------------------------
-    cur.execute(
-        "UPDATE data_imports SET status = 'complete', row_count = %s WHERE id = %s",
-        (data_rows, import_id),
-    )
-    conn.commit()
-
-    print(f"Done. {data_rows:,} rows imported in {elapsed:.1f}s")
+    print(f"Done. {loaded_rows:,} rows imported in {elapsed:.1f}s")
+    if stream.rejected:
+        print(
+            f"  Quarantined {stream.rejected:,} malformed row(s) "
+            f"(budget {max_rejects:,}) to {quarantine_path}"
+        )
     print(f"  Table {table} now has {db_count:,} total rows")
 
     conn.close()
 
+    # ---- rebuild AI exposure aggregates ----------------------------------
+    if table == "employment":
+        try:
+            rebuild_ai_exposure()
+        except Exception as exc:
+            print(
+                f"Warning: AI exposure refresh failed: {exc}. "
+                "Run 'python3 scripts/import.py ai-exposure' to retry."
+            )
+
     # ---- revalidate Next.js cache ----------------------------------------
     revalidate_cache()
 
 
 def main():
-    if len(sys.argv) != 3:
-        sys.exit(
-            "Usage: python3 scripts/import.py <dataset_type> <file_path>\n"
-            "  dataset_type: employment | accessions | separations"
-        )
-    dataset_type = sys.argv[1]
-    filepath = sys.argv[2]
-    run_import(dataset_type, filepath)
+    parser = argparse.ArgumentParser(
+        description="Bulk-load an OPM data file into PostgreSQL.",
+    )
+    parser.add_argument(
+        "dataset_type",
+        help="employment | accessions | separations, or ai-exposure to rebuild "
+             "the AI exposure tables from the current employment snapshot",
+    )
+    parser.add_argument("file_path", nargs="?")
+    parser.add_argument(
+        "--error-budget", type=float, default=DEFAULT_ERROR_BUDGET,
+        help="Malformed rows to quarantine before aborting: a fraction of the "
+             f"data rows if < 1, else a row count (default: {DEFAULT_ERROR_BUDGET}). "
+             "0 aborts on the first malformed row.",
+    )
+    parser.add_argument(
+        "--quarantine", metavar="PATH",
+        help="Where to write malformed rows (default: <file_path>.quarantine.tsv).",
+    )
+    args = parser.parse_args()
+    if args.dataset_type == "ai-exposure":
+        run_ai_exposure_refresh()
+        return
+    if args.file_path is None:
+        parser.error("file_path is required")
+    if args.error_budget < 0:
+        sys.exit("Error: --error-budget must not be negative.")
+    run_import(args.dataset_type, args.file_path, args.error_budget, args.quarantine)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,29 @@
+-- 002-keyset-indexes.sql — (sort column, id) indexes behind keyset pagination
+-- of sorted list views (see buildQuery in src/lib/queries.ts).
+-- Apply: psql "$DATABASE_URL" -f scripts/migrations/002-keyset-indexes.sql   (idempotent)
+-- CONCURRENTLY keeps the tables readable while the indexes build; psql runs
+-- each statement in its own transaction, which CONCURRENTLY requires.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_emp_sort_agency ON employment(agency, id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_emp_sort_state ON employment(duty_station_state, id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_emp_sort_occ_series ON employment(occupational_series, id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_emp_sort_grade ON employment(grade, id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_emp_sort_pay ON employment(annualized_adjusted_basic_pay, id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_emp_sort_education_level ON employment(education_level, id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_emp_sort_age ON employment(age_bracket, id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_emp_sort_los ON employment(length_of_service_years, id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_acc_sort_agency ON accessions(agency, id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_acc_sort_state ON accessions(duty_station_state, id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_acc_sort_occ_series ON accessions(occupational_series, id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_acc_sort_grade ON accessions(grade, id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_acc_sort_pay ON accessions(annualized_adjusted_basic_pay, id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_acc_sort_education_level ON accessions(education_level, id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_acc_sort_age ON accessions(age_bracket, id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_acc_sort_los ON accessions(length_of_service_years, id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_sep_sort_agency ON separations(agency, id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_sep_sort_state ON separations(duty_station_state, id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_sep_sort_occ_series ON separations(occupational_series, id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_sep_sort_grade ON separations(grade, id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_sep_sort_pay ON separations(annualized_adjusted_basic_pay, id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_sep_sort_education_level ON separations(education_level, id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_sep_sort_age ON separations(age_bracket, id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_sep_sort_los ON separations(length_of_service_years, id);
@@ -0,0 +1,28 @@
+-- 003-ai-exposure.sql — AI exposure scores and the /ai-exposure aggregates
+-- precomputed by scripts/import.py after each employment load.
+-- Apply: psql "$DATABASE_URL" -f scripts/migrations/003-ai-exposure.sql   (idempotent)
+-- Then fill the tables once: python3 scripts/import.py ai-exposure
+CREATE TABLE IF NOT EXISTS ai_exposure_scores (
+    occupational_series_code VARCHAR(10) PRIMARY KEY,
+    score SMALLINT NOT NULL,
+    rationale TEXT
+);
+
+CREATE TABLE IF NOT EXISTS ai_exposure_occupations (
+    occupational_series VARCHAR(200),
+    occupational_series_code VARCHAR(10),
+    occupational_group VARCHAR(200),
+    occupational_group_code VARCHAR(20),
+    total_employees BIGINT,
+    avg_pay NUMERIC(10,0),
+    is_stem BOOLEAN,
+    top_education VARCHAR(100)
+);
+
+CREATE TABLE IF NOT EXISTS ai_exposure_breakdowns (
+    dim VARCHAR(10) NOT NULL,
+    bucket VARCHAR(20) NOT NULL,
+    employees BIGINT,
+    weighted_exposure NUMERIC,
+    sort_order SMALLINT
+);
@@ -4,6 +4,9 @@ DROP TABLE IF EXISTS employment CASCADE;
 DROP TABLE IF EXISTS accessions CASCADE;
 DROP TABLE IF EXISTS separations CASCADE;
 DROP TABLE IF EXISTS data_imports CASCADE;
+DROP TABLE IF EXISTS ai_exposure_scores CASCADE;
+DROP TABLE IF EXISTS ai_exposure_occupations CASCADE;
+DROP TABLE IF EXISTS ai_exposure_breakdowns CASCADE;
 
 CREATE TABLE data_imports (
     id SERIAL PRIMARY KEY,
@@ -128,6 +131,34 @@ CREATE TABLE separations (
     work_schedule_code VARCHAR(10)
 );
 
+-- AI exposure: scores loaded from src/data/ai-exposure-scores.json, and the
+-- /ai-exposure aggregates precomputed by scripts/import.py after each
+-- employment load.
+CREATE TABLE ai_exposure_scores (
+    occupational_series_code VARCHAR(10) PRIMARY KEY,
+    score SMALLINT NOT NULL,
+    rationale TEXT
+);
+
+CREATE TABLE ai_exposure_occupations (
+    occupational_series VARCHAR(200),
+    occupational_series_code VARCHAR(10),
+    occupational_group VARCHAR(200),
+    occupational_group_code VARCHAR(20),
+    total_employees BIGINT,
+    avg_pay NUMERIC(10,0),
+    is_stem BOOLEAN,
+    top_education VARCHAR(100)
+);
+
+CREATE TABLE ai_exposure_breakdowns (
+    dim VARCHAR(10) NOT NULL,
+    bucket VARCHAR(20) NOT NULL,
+    employees BIGINT,
+    weighted_exposure NUMERIC,
+    sort_order SMALLINT
+);
+
 -- Employment: single-column indexes
 CREATE INDEX idx_emp_agency ON employment(agency_code);
 CREATE INDEX idx_emp_state ON employment(duty_station_state_abbreviation);
@@ -164,3 +195,31 @@ CREATE INDEX idx_sep_category ON separations(separation_category_code);
 CREATE INDEX idx_emp_import ON employment(import_id);
 CREATE INDEX idx_acc_import ON accessions(import_id);
 CREATE INDEX idx_sep_import ON separations(import_id);
+
+-- Keyset pagination: one (sort column, id) index per SORT_ALLOWLIST column in
+-- src/lib/queries.ts. Sorted list pages seek with (col, id) > (v, id); DESC
+-- sorts scan the same index backward.
+CREATE INDEX idx_emp_sort_agency ON employment(agency, id);
+CREATE INDEX idx_emp_sort_state ON employment(duty_station_state, id);
+CREATE INDEX idx_emp_sort_occ_series ON employment(occupational_series, id);
+CREATE INDEX idx_emp_sort_grade ON employment(grade, id);
+CREATE INDEX idx_emp_sort_pay ON employment(annualized_adjusted_basic_pay, id);
+CREATE INDEX idx_emp_sort_education_level ON employment(education_level, id);
+CREATE INDEX idx_emp_sort_age ON employment(age_bracket, id);
+CREATE INDEX idx_emp_sort_los ON employment(length_of_service_years, id);
+CREATE INDEX idx_acc_sort_agency ON accessions(agency, id);
+CREATE INDEX idx_acc_sort_state ON accessions(duty_station_state, id);
+CREATE INDEX idx_acc_sort_occ_series ON accessions(occupational_series, id);
+CREATE INDEX idx_acc_sort_grade ON accessions(grade, id);
+CREATE INDEX idx_acc_sort_pay ON accessions(annualized_adjusted_basic_pay, id);
+CREATE INDEX idx_acc_sort_education_level ON accessions(education_level, id);
+CREATE INDEX idx_acc_sort_age ON accessions(age_bracket, id);
+CREATE INDEX idx_acc_sort_los ON accessions(length_of_service_years, id);
+CREATE INDEX idx_sep_sort_agency ON separations(agency, id);
+CREATE INDEX idx_sep_sort_state ON separations(duty_station_state, id);
+CREATE INDEX idx_sep_sort_occ_series ON separations(occupational_series, id);
+CREATE INDEX idx_sep_sort_grade ON separations(grade, id);
+CREATE INDEX idx_sep_sort_pay ON separations(annualized_adjusted_basic_pay, id);
+CREATE INDEX idx_sep_sort_education_level ON separations(education_level, id);
+CREATE INDEX idx_sep_sort_age ON separations(age_bracket, id);
+CREATE INDEX idx_sep_sort_los ON separations(length_of_service_years, id);
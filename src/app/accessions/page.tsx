@@ -8,8 +8,8 @@ export const metadata: Metadata = {
     "Browse new hires and accessions into federal service, filterable by agency, occupation, state, and more.",
   alternates: { canonical: "/accessions" },
 };
-import { query } from "@/lib/db";
-import { buildQuery, type FilterParams } from "@/lib/queries";
+import { cachedListQuery } from "@/lib/list-cache";
+import { buildQuery, getNextCursor, type FilterParams } from "@/lib/queries";
 import { getFilterOptions } from "@/lib/filters";
 import { FilterSidebar, MobileFilterButton } from "@/components/filter-sidebar";
 import { DataTable } from "@/components/data-table";
@@ -52,6 +52,7 @@ async function AccessionsContent({
     ),
     sort: getParam(searchParams, "sort"),
     sortDir: getParam(searchParams, "sortDir") as "asc" | "desc" | undefined,
+    cursor: getParam(searchParams, "cursor"),
     page: getParam(searchParams, "page")
       ? Number(getParam(searchParams, "page"))
       : undefined,
@@ -60,21 +61,13 @@ async function AccessionsContent({
       : undefined,
   };
 
-  const {
-    sql,
-    params: qParams,
-    countSql,
-    countParams,
-  } = buildQuery("accessions", filters);
+  const built = buildQuery("accessions", filters);
 
-  const [rows, countResult, options] = await Promise.all([
-    query(sql, qParams),
-    query<{ count: string }>(countSql, countParams),
+  const [{ rows, total }, options] = await Promise.all([
+    cachedListQuery("accessions", built),
     getFilterOptions("accessions"),
   ]);
 
-  const total = Number(countResult[0]?.count ?? "0");
-
   const activeFilters: Record<string, string> = {};
   for (const [key, value] of Object.entries(searchParams)) {
     if (value && typeof value === "string") {
@@ -105,6 +98,7 @@ async function AccessionsContent({
           total={total}
           dataset="accessions"
           filters={activeFilters}
+          nextCursor={getNextCursor(built.keyset, rows)}
         />
       </div>
     </div>
@@ -1,6 +1,6 @@
 import { NextRequest, NextResponse } from "next/server";
-import { buildQuery, type FilterParams } from "@/lib/queries";
-import { query } from "@/lib/db";
+import { buildQuery, getNextCursor, type FilterParams } from "@/lib/queries";
+import { cachedListQuery } from "@/lib/list-cache";
 
 export const maxDuration = 30;
 
@@ -31,23 +31,15 @@ export async function GET(request: NextRequest) {
         : undefined,
     };
 
-    const {
-      sql,
-      params: qParams,
-      countSql,
-      countParams,
-    } = buildQuery("employment", filters);
-
-    const [rows, countResult] = await Promise.all([
-      query(sql, qParams),
-      query<{ count: string }>(countSql, countParams),
-    ]);
+    const built = buildQuery("employment", filters);
+    const { rows, total } = await cachedListQuery("employment", built);
 
     return NextResponse.json({
       data: rows,
-      total: Number(countResult[0].count),
+      total,
       page: filters.page ?? 1,
       pageSize: filters.pageSize ?? 50,
+      nextCursor: getNextCursor(built.keyset, rows),
     });
   } catch (error) {
     console.error("Employment API error:", error);
@@ -1,4 +1,5 @@
 import { query } from "@/lib/db";
+import { getListCacheStats } from "@/lib/list-cache";
 import { NextResponse } from "next/server";
 
 export async function GET() {
@@ -9,6 +10,7 @@ export async function GET() {
     return NextResponse.json({
       status: "ok",
       employment_count: rows[0].count,
+      list_cache: getListCacheStats(),
     });
   } catch (error) {
     console.error("Health check error:", error);
@@ -1,6 +1,7 @@
 import { timingSafeEqual } from "node:crypto";
-import { revalidateTag } from "next/cache";
+import { revalidatePath, revalidateTag } from "next/cache";
 import { NextRequest, NextResponse } from "next/server";
+import { resetListCacheGenerations } from "@/lib/list-cache";
 
 function tokenMatches(provided: string | undefined, expected: string): boolean {
   if (typeof provided !== "string") return false;
@@ -36,5 +37,8 @@ export async function POST(request: NextRequest) {
   revalidateTag("stats", { expire: 0 });
   revalidateTag("homepage-insights", { expire: 0 });
   revalidateTag("insights", { expire: 0 });
+  // Reads the AI exposure tables import.py rebuilds with each employment load.
+  revalidatePath("/ai-exposure");
+  resetListCacheGenerations();
   return NextResponse.json({ revalidated: true });
 }
@@ -8,8 +8,8 @@ export const metadata: Metadata = {
     "Browse and filter current federal workforce employment records by agency, state, occupation, grade, and pay.",
   alternates: { canonical: "/employment" },
 };
-import { query } from "@/lib/db";
-import { buildQuery, type FilterParams } from "@/lib/queries";
+import { cachedListQuery } from "@/lib/list-cache";
+import { buildQuery, getNextCursor, type FilterParams } from "@/lib/queries";
 import { getFilterOptions } from "@/lib/filters";
 import { FilterSidebar, MobileFilterButton } from "@/components/filter-sidebar";
 import { DataTable } from "@/components/data-table";
@@ -48,6 +48,7 @@ async function EmploymentContent({
     sensitive_occupation: getParam(searchParams, "sensitive_occupation"),
     sort: getParam(searchParams, "sort"),
     sortDir: getParam(searchParams, "sortDir") as "asc" | "desc" | undefined,
+    cursor: getParam(searchParams, "cursor"),
     page: getParam(searchParams, "page")
       ? Number(getParam(searchParams, "page"))
       : undefined,
@@ -56,21 +57,13 @@ async function EmploymentContent({
       : undefined,
   };
 
-  const {
-    sql,
-    params: qParams,
-    countSql,
-    countParams,
-  } = buildQuery("employment", filters);
+  const built = buildQuery("employment", filters);
 
-  const [rows, countResult, options] = await Promise.all([
-    query(sql, qParams),
-    query<{ count: string }>(countSql, countParams),
+  const [{ rows, total }, options] = await Promise.all([
+    cachedListQuery("employment", built),
     getFilterOptions("employment"),
   ]);
 
-  const total = Number(countResult[0]?.count ?? "0");
-
   const activeFilters: Record<string, string> = {};
   for (const [key, value] of Object.entries(searchParams)) {
     if (value && typeof value === "string") {
@@ -101,6 +94,7 @@ async function EmploymentContent({
           total={total}
           dataset="employment"
           filters={activeFilters}
+          nextCursor={getNextCursor(built.keyset, rows)}
         />
       </div>
     </div>
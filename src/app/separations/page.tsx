@@ -8,8 +8,8 @@ export const metadata: Metadata = {
     "Browse federal workforce departures including retirements, resignations, and terminations.",
   alternates: { canonical: "/separations" },
 };
-import { query } from "@/lib/db";
-import { buildQuery, type FilterParams } from "@/lib/queries";
+import { cachedListQuery } from "@/lib/list-cache";
+import { buildQuery, getNextCursor, type FilterParams } from "@/lib/queries";
 import { getFilterOptions } from "@/lib/filters";
 import { FilterSidebar, MobileFilterButton } from "@/components/filter-sidebar";
 import { DataTable } from "@/components/data-table";
@@ -52,6 +52,7 @@ async function SeparationsContent({
     ),
     sort: getParam(searchParams, "sort"),
     sortDir: getParam(searchParams, "sortDir") as "asc" | "desc" | undefined,
+    cursor: getParam(searchParams, "cursor"),
     page: getParam(searchParams, "page")
       ? Number(getParam(searchParams, "page"))
       : undefined,
@@ -60,21 +61,13 @@ async function SeparationsContent({
       : undefined,
   };
 
-  const {
-    sql,
-    params: qParams,
-    countSql,
-    countParams,
-  } = buildQuery("separations", filters);
+  const built = buildQuery("separations", filters);
 
-  const [rows, countResult, options] = await Promise.all([
-    query(sql, qParams),
-    query<{ count: string }>(countSql, countParams),
+  const [{ rows, total }, options] = await Promise.all([
+    cachedListQuery("separations", built),
     getFilterOptions("separations"),
   ]);
 
-  const total = Number(countResult[0]?.count ?? "0");
-
   const activeFilters: Record<string, string> = {};
   for (const [key, value] of Object.entries(searchParams)) {
     if (value && typeof value === "string") {
@@ -106,6 +99,7 @@ async function SeparationsContent({
           total={total}
           dataset="separations"
           filters={activeFilters}
+          nextCursor={getNextCursor(built.keyset, rows)}
         />
       </div>
     </div>
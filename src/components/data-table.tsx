@@ -19,6 +19,7 @@ interface DataTableProps {
   total: number;
   dataset: Dataset;
   filters: Record<string, string>;
+  nextCursor: string | null;
 }
 
 const payFormatter = new Intl.NumberFormat("en-US", {
@@ -271,11 +272,19 @@ export function DataTable({
   total: initialTotal,
   dataset,
   filters,
+  nextCursor: initialNextCursor,
 }: DataTableProps) {
   const router = useRouter();
   const searchParams = useSearchParams();
   const [data, setData] = useState<Row[]>(initialData);
   const [total, setTotal] = useState(initialTotal);
+  // The next-page cursor, tagged with the query string it was fetched for:
+  // the URL moves ahead as soon as a page is clicked, so a cursor from an
+  // earlier response must not be filed under the new page.
+  const [nextCursor, setNextCursor] = useState(() => ({
+    params: searchParams.toString(),
+    cursor: initialNextCursor,
+  }));
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState<string | null>(null);
   const [prevInitialData, setPrevInitialData] = useState(initialData);
@@ -289,6 +298,12 @@ export function DataTable({
   // Track whether we've made a client-side navigation
   const isInitialRender = useRef(true);
   const prevParamsStr = useRef(searchParams.toString());
+  // Keyset cursors of pages already visited in this view, so stepping back
+  // (or forward again) seeks instead of falling back to a deep OFFSET.
+  const pageCursors = useRef<{ view: string; cursors: Map<number, string> }>({
+    view: "",
+    cursors: new Map(),
+  });
 
   const page = Number(searchParams.get("page") || "1");
   const pageSize = Number(searchParams.get("pageSize") || "50");
@@ -322,6 +337,7 @@ export function DataTable({
       .then((json) => {
         setData(json.data);
         setTotal(json.total);
+        setNextCursor({ params: currentStr, cursor: json.nextCursor ?? null });
         setError(null);
       })
       .catch((err) => {
@@ -342,15 +358,37 @@ export function DataTable({
     setPrevInitialData(initialData);
     setData(initialData);
     setTotal(initialTotal);
+    setNextCursor({
+      params: searchParams.toString(),
+      cursor: initialNextCursor,
+    });
   }
 
   const handlePageChange = useCallback(
     (newPage: number) => {
       const params = new URLSearchParams(searchParams.toString());
+      const current = params.get("cursor");
+      params.delete("page");
+      params.delete("cursor");
+
+      // Cursors are only valid for the filters/sort they were issued under.
+      const view = params.toString();
+      const remembered = pageCursors.current;
+      if (remembered.view !== view) {
+        remembered.view = view;
+        remembered.cursors = new Map();
+      }
+      if (current) remembered.cursors.set(page, current);
+      if (nextCursor.cursor && nextCursor.params === searchParams.toString()) {
+        remembered.cursors.set(page + 1, nextCursor.cursor);
+      }
+
       params.set("page", String(newPage));
+      const cursor = newPage > 1 ? remembered.cursors.get(newPage) : undefined;
+      if (cursor) params.set("cursor", cursor);
       router.replace(`?${params.toString()}`, { scroll: false });
     },
-    [router, searchParams]
+    [router, searchParams, page, nextCursor]
   );
 
   const handlePageSizeChange = useCallback(
@@ -358,6 +396,7 @@ export function DataTable({
       const params = new URLSearchParams(searchParams.toString());
       params.set("pageSize", String(newSize));
       params.delete("page");
+      params.delete("cursor");
       router.replace(`?${params.toString()}`, { scroll: false });
     },
     [router, searchParams]
@@ -374,6 +413,7 @@ export function DataTable({
         params.delete("sortDir");
       }
       params.delete("page");
+      params.delete("cursor");
       router.replace(`?${params.toString()}`, { scroll: false });
     },
     [router, searchParams]
@@ -294,6 +294,7 @@ function useFilterState() {
         params.delete(key);
       }
       params.delete("page");
+      params.delete("cursor");
       router.replace(`?${params.toString()}`, { scroll: false });
     },
     [router, searchParams]
@@ -305,6 +306,7 @@ function useFilterState() {
       params.delete(key);
     }
     params.delete("page");
+    params.delete("cursor");
     router.replace(`?${params.toString()}`, { scroll: false });
   }, [router, searchParams]);
 
@@ -0,0 +1,248 @@
+/**
+ * Result cache for the list views (`/api/{employment,accessions,separations}`
+ * and the matching pages). Their rows and COUNT(*) only change when
+ * scripts/import.py commits, so results are keyed by the normalized query
+ * (buildQuery's SQL + params) and the dataset's data generation — the latest
+ * complete `data_imports.id`. A new import changes the generation, so stale
+ * entries are never read again and simply age out of the LRU.
+ *
+ * In-process LRU bounded by entry count and approximate size; optionally
+ * backed by a shared Redis REST endpoint (Upstash-compatible) so several app
+ * instances share results. The shared backend is best-effort: any failure
+ * falls back to Postgres.
+ */
+
+import { createHash } from "node:crypto";
+import { query } from "@/lib/db";
+import type { BuildQueryResult } from "@/lib/queries";
+
+type Dataset = "employment" | "accessions" | "separations";
+
+type Row = Record<string, unknown>;
+
+function positiveIntEnv(name: string, fallback: number): number {
+  const raw = process.env[name]?.trim() ?? "";
+  // A typo'd value would otherwise be NaN (no size ever exceeds NaN, so the
+  // LRU would never evict) or, for "1OO", parseInt's silent prefix of 1.
+  const value = /^\d+$/.test(raw) ? Number.parseInt(raw, 10) : NaN;
+  return Number.isFinite(value) && value > 0 ? value : fallback;
+}
+
+const MAX_ENTRIES = positiveIntEnv("LIST_CACHE_MAX_ENTRIES", 1000);
+const MAX_BYTES = positiveIntEnv("LIST_CACHE_MAX_BYTES", 64 * 1024 * 1024);
+// How long a looked-up generation is trusted before asking Postgres again.
+// /api/revalidate (called by import.py) resets it, so this only bounds
+// staleness for instances the revalidate call didn't reach.
+const GENERATION_TTL_MS = 5000;
+// Shared entries outlive any generation we'd still read; this just lets
+// Redis reclaim them.
+const SHARED_TTL_SECONDS = 7 * 86400;
+
+interface CacheEntry {
+  value: unknown;
+  bytes: number;
+}
+
+interface ListCacheState {
+  entries: Map<string, CacheEntry>;
+  bytes: number;
+  generations: Map<Dataset, { id: number; at: number }>;
+  // Loads in flight, so concurrent misses on one key share a single query.
+  pending: Map<string, Promise<unknown>>;
+  stats: {
+    hits: number;
+    sharedHits: number;
+    coalesced: number;
+    misses: number;
+    evictions: number;
+  };
+}
+
+const globalForCache = globalThis as typeof globalThis & {
+  listCache?: ListCacheState;
+};
+
+const state: ListCacheState = globalForCache.listCache ?? {
+  entries: new Map(),
+  bytes: 0,
+  generations: new Map(),
+  pending: new Map(),
+  stats: { hits: 0, sharedHits: 0, coalesced: 0, misses: 0, evictions: 0 },
+};
+
+globalForCache.listCache = state;
+
+/* ── In-process LRU ── */
+
+function lruGet(key: string): unknown {
+  const entry = state.entries.get(key);
+  if (!entry) return undefined;
+  // Map iteration order is insertion order: re-inserting marks it recent.
+  state.entries.delete(key);
+  state.entries.set(key, entry);
+  return entry.value;
+}
+
+function lruSet(key: string, value: unknown, bytes: number) {
+  if (bytes > MAX_BYTES) return;
+  const existing = state.entries.get(key);
+  if (existing) {
+    state.entries.delete(key);
+    state.bytes -= existing.bytes;
+  }
+  state.entries.set(key, { value, bytes });
+  state.bytes += bytes;
+  while (state.entries.size > MAX_ENTRIES || state.bytes > MAX_BYTES) {
+    const oldest = state.entries.keys().next().value as string;
+    state.bytes -= state.entries.get(oldest)!.bytes;
+    state.entries.delete(oldest);
+    state.stats.evictions++;
+  }
+}
+
+/* ── Shared backend (Redis REST) ── */
+
+function sharedBackend(): { url: string; token: string } | null {
+  const url = process.env.LIST_CACHE_REDIS_REST_URL;
+  const token = process.env.LIST_CACHE_REDIS_REST_TOKEN;
+  return url && token ? { url: url.replace(/\/+$/, ""), token } : null;
+}
+
+async function sharedCommand(command: (string | number)[]): Promise<unknown> {
+  const backend = sharedBackend();
+  if (!backend) return null;
+  try {
+    const res = await fetch(backend.url, {
+      method: "POST",
+      headers: { Authorization: `Bearer ${backend.token}` },
+      body: JSON.stringify(command),
+      cache: "no-store",
+      signal: AbortSignal.timeout(250),
+    });
+    if (!res.ok) return null;
+    const json = (await res.json()) as { result?: unknown };
+    return json.result ?? null;
+  } catch (err) {
+    console.warn("List cache: shared backend unavailable:", err);
+    return null;
+  }
+}
+
+/* ── Generation ── */
+
+// Relies on scripts/import.py setting status = 'complete' in the same
+// transaction that commits the rows, so new data always comes with a new id.
+async function getGeneration(dataset: Dataset): Promise<number> {
+  const known = state.generations.get(dataset);
+  if (known && Date.now() - known.at < GENERATION_TTL_MS) return known.id;
+  const rows = await query<{ id: number | null }>(
+    "SELECT MAX(id) as id FROM data_imports WHERE dataset_type = $1 AND status = 'complete'",
+    [dataset]
+  );
+  const id = Number(rows[0]?.id ?? 0);
+  state.generations.set(dataset, { id, at: Date.now() });
+  return id;
+}
+
+/** Forget looked-up generations so the next request sees a fresh import. */
+export function resetListCacheGenerations() {
+  state.generations.clear();
+}
+
+/* ── Public API ── */
+
+async function cached<T>(key: string, load: () => Promise<T>): Promise<T> {
+  const local = lruGet(key);
+  if (local !== undefined) {
+    state.stats.hits++;
+    return local as T;
+  }
+
+  let pending = state.pending.get(key) as Promise<T> | undefined;
+  if (pending) {
+    state.stats.coalesced++;
+  } else {
+    pending = fill(key, load).finally(() => state.pending.delete(key));
+    state.pending.set(key, pending);
+  }
+  return pending;
+}
+
+async function fill<T>(key: string, load: () => Promise<T>): Promise<T> {
+  const shared = await sharedCommand(["GET", key]);
+  if (typeof shared === "string") {
+    try {
+      const value = JSON.parse(shared) as T;
+      state.stats.sharedHits++;
+      lruSet(key, value, shared.length);
+      return value;
+    } catch (err) {
+      // A corrupt or truncated entry is a miss; the SET below replaces it.
+      console.warn("List cache: ignoring unreadable shared entry:", err);
+    }
+  }
+
+  state.stats.misses++;
+  const value = await load();
+  const json = JSON.stringify(value);
+  lruSet(key, value, json.length);
+  void sharedCommand(["SET", key, json, "EX", SHARED_TTL_SECONDS]);
+  return value;
+}
+
+function cacheKey(
+  kind: "rows" | "count",
+  dataset: Dataset,
+  generation: number,
+  sql: string,
+  params: (string | number | null)[]
+): string {
+  const digest = createHash("sha1")
+    .update(JSON.stringify([sql, params]))
+    .digest("hex");
+  return `list:${dataset}:${generation}:${kind}:${digest}`;
+}
+
+/**
+ * Run a buildQuery() result's row and count queries through the cache.
+ * Counts are keyed separately, so every page of a filter view shares one.
+ */
+export async function cachedListQuery(
+  dataset: Dataset,
+  built: BuildQueryResult
+): Promise<{ rows: Row[]; total: number }> {
+  const generation = await getGeneration(dataset);
+  const [rows, total] = await Promise.all([
+    cached(
+      cacheKey("rows", dataset, generation, built.sql, built.params),
+      () => query(built.sql, built.params)
+    ),
+    cached(
+      cacheKey("count", dataset, generation, built.countSql, built.countParams),
+      async () => {
+        const result = await query<{ count: string }>(
+          built.countSql,
+          built.countParams
+        );
+        return Number(result[0]?.count ?? "0");
+      }
+    ),
+  ]);
+  return { rows, total };
+}
+
+export function getListCacheStats() {
+  const { hits, sharedHits, coalesced, misses, evictions } = state.stats;
+  const lookups = hits + sharedHits + coalesced + misses;
+  return {
+    entries: state.entries.size,
+    bytes: state.bytes,
+    hits,
+    sharedHits,
+    coalesced,
+    misses,
+    evictions,
+    hitRate: lookups > 0 ? (hits + sharedHits + coalesced) / lookups : 0,
+    shared: sharedBackend() !== null,
+  };
+}
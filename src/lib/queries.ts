@@ -1,3 +1,5 @@
+import { createHash } from "node:crypto";
+
 export interface FilterParams {
   agency_code?: string;
   duty_station_state_abbreviation?: string;
@@ -39,6 +41,22 @@ export interface BuildQueryResult {
   params: (string | number | null)[];
   countSql: string;
   countParams: (string | number | null)[];
+  keyset: KeysetInfo;
+}
+
+// What a page's cursor is bound to. The fingerprint covers the table, filters
+// and sort, so a cursor carried over from a different view is ignored and the
+// query falls back to OFFSET instead of seeking to the wrong place.
+export interface KeysetInfo {
+  sortColumn: string | null;
+  sortDirection: "ASC" | "DESC";
+  pageSize: number;
+  fingerprint: string;
+}
+
+interface KeysetCursor {
+  v: string | number | null;
+  id: number;
 }
 
 const SORT_ALLOWLIST = new Set([
@@ -52,6 +70,15 @@ const SORT_ALLOWLIST = new Set([
   "length_of_service_years",
 ]);
 
+// NUMERIC sort columns: a cursor value for these is bound as a numeric
+// parameter, so anything else would fail the cast and 500 the query.
+const NUMERIC_SORT_COLUMNS = new Set([
+  "annualized_adjusted_basic_pay",
+  "length_of_service_years",
+]);
+
+const NUMERIC_VALUE = /^[+-]?(?:\d+(?:\.\d*)?|\.\d+)$/;
+
 const MAX_PAGE_SIZE = 100;
 const DEFAULT_PAGE_SIZE = 50;
 // Upper bound on `page` so a pathological ?page= value can't produce an
@@ -77,6 +104,103 @@ const FILTER_COLUMN_MAP: Record<string, string> = {
 
 const ALLOWED_TABLES = new Set<Dataset>(["employment", "accessions", "separations"]);
 
+function cursorFingerprint(
+  table: string,
+  sortColumn: string | null,
+  sortDirection: "ASC" | "DESC",
+  whereClause: string,
+  whereParams: (string | number | null)[]
+): string {
+  return createHash("sha1")
+    .update(JSON.stringify([table, sortColumn, sortDirection, whereClause, whereParams]))
+    .digest("hex")
+    .slice(0, 12);
+}
+
+function decodeCursor(
+  raw: string | undefined,
+  keyset: KeysetInfo
+): KeysetCursor | null {
+  if (!raw) return null;
+  // Legacy cursor: a bare row id, only meaningful for the unsorted id order.
+  if (/^\d+$/.test(raw)) {
+    const id = Number(raw);
+    return !keyset.sortColumn && Number.isSafeInteger(id) ? { v: null, id } : null;
+  }
+  try {
+    const decoded: unknown = JSON.parse(
+      Buffer.from(raw, "base64url").toString("utf8")
+    );
+    if (!Array.isArray(decoded) || decoded.length !== 3) return null;
+    const [fingerprint, v, id] = decoded;
+    if (fingerprint !== keyset.fingerprint) return null;
+    if (!Number.isSafeInteger(id)) return null;
+    if (v !== null && typeof v !== "string" && typeof v !== "number") return null;
+    // The cursor is only encoded, not signed: check v still fits the column.
+    if (
+      v !== null &&
+      keyset.sortColumn &&
+      NUMERIC_SORT_COLUMNS.has(keyset.sortColumn) &&
+      !(typeof v === "number" ? Number.isFinite(v) : NUMERIC_VALUE.test(v))
+    ) {
+      return null;
+    }
+    return { v, id };
+  } catch {
+    return null;
+  }
+}
+
+/**
+ * Seek predicates for the page after *cursor*. Usually a single row
+ * comparison; when the sort column's NULLs lie between the cursor and the end
+ * of the order (they sort last ASC, first DESC) a second branch covers them.
+ */
+function keysetConditions(
+  keyset: KeysetInfo,
+  cursor: KeysetCursor,
+  paramIndex: number
+): { branches: string[]; params: (string | number)[] } {
+  const col = keyset.sortColumn;
+  const a = `$${paramIndex}`;
+  const b = `$${paramIndex + 1}`;
+
+  if (!col) {
+    return { branches: [`id > ${a}`], params: [cursor.id] };
+  }
+  if (keyset.sortDirection === "ASC") {
+    return cursor.v === null
+      ? { branches: [`${col} IS NULL AND id > ${a}`], params: [cursor.id] }
+      : {
+          branches: [`(${col}, id) > (${a}, ${b})`, `${col} IS NULL`],
+          params: [cursor.v, cursor.id],
+        };
+  }
+  return cursor.v === null
+    ? {
+        branches: [`${col} IS NULL AND id < ${a}`, `${col} IS NOT NULL`],
+        params: [cursor.id],
+      }
+    : { branches: [`(${col}, id) < (${a}, ${b})`], params: [cursor.v, cursor.id] };
+}
+
+/**
+ * Opaque cursor for the page after *rows*, or null when *rows* is the last
+ * page. Pass it back as `cursor` to keyset-paginate instead of using OFFSET.
+ */
+export function getNextCursor(
+  keyset: KeysetInfo,
+  rows: Record<string, unknown>[]
+): string | null {
+  if (rows.length < keyset.pageSize) return null;
+  const last = rows[rows.length - 1];
+  const raw = keyset.sortColumn ? last[keyset.sortColumn] : null;
+  const v = typeof raw === "string" || typeof raw === "number" ? raw : null;
+  return Buffer.from(
+    JSON.stringify([keyset.fingerprint, v, Number(last.id)])
+  ).toString("base64url");
+}
+
 export function buildQuery(
   dataset: Dataset,
   filters: FilterParams
@@ -171,39 +295,58 @@ export function buildQuery(
     ? Math.min(Math.max(1, Math.floor(rawPage)), MAX_PAGE)
     : 1;
 
-  let orderClause: string;
-  let limitClause: string;
+  // The id tie-break follows the sort direction so a single (column, id)
+  // index serves both directions (scanned backward for DESC), and so the
+  // keyset predicate below can be a plain row comparison.
+  const orderClause = sortColumn
+    ? `ORDER BY ${sortColumn} ${sortDirection}, id ${sortDirection}`
+    : "ORDER BY id ASC";
 
-  if (filters.cursor && !sortColumn) {
-    // Cursor-based pagination on id column
-    conditions.push(`id > $${paramIndex}`);
-    params.push(Number(filters.cursor));
-    paramIndex++;
-    orderClause = "ORDER BY id ASC";
-    limitClause = `LIMIT $${paramIndex}`;
+  const fingerprint = cursorFingerprint(
+    table,
+    sortColumn,
+    sortDirection,
+    whereClause,
+    countParams
+  );
+  const keyset: KeysetInfo = { sortColumn, sortDirection, pageSize, fingerprint };
+  const cursor = decodeCursor(filters.cursor, keyset);
+
+  let sql: string;
+
+  if (cursor) {
+    // Keyset pagination: seek past the last row of the previous page instead
+    // of sorting and discarding OFFSET rows, so page N costs what page 1 does.
+    const seek = keysetConditions(keyset, cursor, paramIndex);
+    params.push(...seek.params);
+    paramIndex += seek.params.length;
+    const limitClause = `LIMIT $${paramIndex}`;
     params.push(pageSize);
     paramIndex++;
+
+    const branches = seek.branches.map((branch) => {
+      const where = `WHERE ${[...conditions, branch].join(" AND ")}`;
+      return `SELECT * FROM ${table} ${where} ${orderClause} ${limitClause}`;
+    });
+    sql =
+      branches.length === 1
+        ? branches[0]
+        : // NULL sort values sit at one end of the order and can't be reached
+          // by a row comparison; each branch is an index-ordered LIMIT scan and
+          // the outer sort only ever sees 2 * pageSize rows.
+          `SELECT * FROM (${branches
+            .map((b) => `(${b})`)
+            .join(" UNION ALL ")}) AS page ${orderClause} ${limitClause}`;
   } else {
-    // Offset-based pagination (with or without sort)
+    // Offset-based pagination: first page, or a jump to a page we have no
+    // cursor for.
     const offset = (page - 1) * pageSize;
-
-    if (sortColumn) {
-      orderClause = `ORDER BY ${sortColumn} ${sortDirection}, id ASC`;
-    } else {
-      orderClause = "ORDER BY id ASC";
-    }
-
-    limitClause = `LIMIT $${paramIndex} OFFSET $${paramIndex + 1}`;
+    const limitClause = `LIMIT $${paramIndex} OFFSET $${paramIndex + 1}`;
     params.push(pageSize);
     params.push(offset);
     paramIndex += 2;
+    sql = `SELECT * FROM ${table} ${whereClause} ${orderClause} ${limitClause}`;
   }
 
-  // Rebuild WHERE clause with cursor condition if added
-  const fullWhereClause =
-    conditions.length > 0 ? `WHERE ${conditions.join(" AND ")}` : "";
-
-  const sql = `SELECT * FROM ${table} ${fullWhereClause} ${orderClause} ${limitClause}`;
-
-  return { sql, params, countSql, countParams };
+  return { sql, params, countSql, countParams, keyset };
 }